@@ -21,6 +21,9 @@ setuptools.setup(
     install_requires=[
      "pya2lparser", "pyxcpcanmaster"
       ],
+    extras_require={
+     "fast": ["numpy", "numba"]
+      },
     packages=[
         'xcp_calib_api'
         ],
@@ -2,8 +2,12 @@
 # -*- coding: utf-8 -*-
 
 from __future__ import annotations
-from typing import Literal, Optional, Dict, Any, Tuple, Callable, List
+from typing import Literal, Optional, Dict, Any, Tuple, Callable, List, NamedTuple
+import re
 import struct
+import sys
+from bisect import bisect_right
+from types import MappingProxyType
 
 from xcp_can_master.xcp_master import XcpCanMaster
 from a2lparser.a2l_parser import A2LModel, Measurement, Characteristic,RecordLayout, CompuMethod
@@ -17,6 +21,169 @@ from a2lparser.a2l_parser import A2LModel, Measurement, Characteristic,RecordLay
 # from a2l_parser import A2LModel, Measurement, Characteristic, RecordLayout, CompuMethod, MemorySegment
 # from xcp_can_master import XcpCanMaster
 
+# ASAP2 datatype token (+ common synonyms) -> struct format code
+_DT_TO_CODE: Dict[str, str] = {
+    "UBYTE": "B", "U8": "B", "BYTE": "B", "BOOLEAN": "B", "BOOL": "B",
+    "SBYTE": "b", "S8": "b",
+    "UWORD": "H", "U16": "H", "WORD": "H",
+    "SWORD": "h", "S16": "h",
+    "UDWORD": "I", "ULONG": "I", "U32": "I",
+    "SDWORD": "i", "SLONG": "i", "S32": "i", "LONG": "i",
+    "U64": "Q", "A_UINT64": "Q", "QWORD": "Q",
+    "S64": "q", "A_INT64": "q",
+    "FLOAT32_IEEE": "f",
+    "FLOAT64_IEEE": "d",
+}
+
+
+class DtypeInfo(NamedTuple):
+    size: int
+    signed: bool
+    is_float: bool
+    min_v: Optional[int]
+    max_v: Optional[int]
+    struct_code: str
+
+
+def _make_dtype_info(code: str) -> DtypeInfo:
+    size = struct.calcsize("<" + code)
+    if code in ("f", "d"):
+        return DtypeInfo(size, False, True, None, None, code)
+    if code.islower():
+        return DtypeInfo(size, True, False, -(1 << (8*size - 1)), (1 << (8*size - 1)) - 1, code)
+    return DtypeInfo(size, False, False, 0, (1 << (8*size)) - 1, code)
+
+
+# Precomputed size/signedness/range per datatype token
+_DTYPE_TABLE: Dict[str, DtypeInfo] = {dt: _make_dtype_info(code) for dt, code in _DT_TO_CODE.items()}
+
+
+# Whitespace-delimited datatype token inside RECORD_LAYOUT entries (first match wins)
+_KNOWN_RE = re.compile(
+    r"(?<!\S)(" + "|".join(sorted(_DTYPE_TABLE, key=len, reverse=True)) + r")(?!\S)",
+    re.IGNORECASE,
+)
+
+def _flatten_segments(rows: List[Tuple[int, int, Optional[int]]]) -> List[Tuple[int, int, int]]:
+    """
+    Turns (lo, hi, addr_ext) MEMORY_SEGMENT ranges given in A2L order into sorted, non-overlapping intervals.
+    Where segments overlap or nest, the one listed first keeps the shared range (first match wins, as in
+    a linear scan). Ranges owned by a segment without address extension are dropped: they resolve to
+    default_addr_ext.
+    """
+    claimed: List[Tuple[int, int, Optional[int]]] = []  # disjoint, sorted by start
+    for lo, hi, ae in rows:
+        pieces = []
+        cur = lo
+        for c_lo, c_hi, _ in claimed:
+            if c_hi <= cur:
+                continue
+            if c_lo >= hi:
+                break
+            if c_lo > cur:
+                pieces.append((cur, c_lo, ae))
+            cur = c_hi
+            if cur >= hi:
+                break
+        if cur < hi:
+            pieces.append((cur, hi, ae))
+        claimed.extend(pieces)
+        claimed.sort(key=lambda row: row[0])
+    return [row for row in claimed if row[2] is not None]
+
+
+# Largest hole (in bytes) bridged when coalescing neighbouring measurements into one upload
+_MAX_READ_GAP = 4
+
+# Number of name lists read_measurements_phys keeps decode plans for
+_MAX_PHYS_PLANS = 32
+
+
+# numpy/numba are optional and imported on first use of read_measurements_phys, see _get_linear_kernel
+np = None
+# JIT-compiled _decode_linear_scalars; False once numpy/numba turned out to be unavailable
+_linear_kernel = None
+
+# Type codes understood by _decode_linear_scalars, keyed by struct format code
+_KERNEL_TYPE_CODES: Dict[str, int] = {"B": 0, "b": 1, "H": 2, "h": 3, "I": 4, "i": 5, "f": 6, "d": 7}
+
+
+def _identity(x):
+    return x
+
+
+def _decode_linear_scalars(buf, offsets, type_codes, big_endian, a, b, out):
+    """
+    Decodes the scalar at each offset of buf (uint8 array) and stores a*raw + b into out.
+    Type codes: 0=U8, 1=S8, 2=U16, 3=S16, 4=U32, 5=S32, 6=F32, 7=F64.
+    """
+    bits32 = np.zeros(1, np.uint32)
+    bits64 = np.zeros(1, np.uint64)
+    f32 = bits32.view(np.float32)
+    f64 = bits64.view(np.float64)
+    for i in range(offsets.shape[0]):
+        off = offsets[i]
+        tc = type_codes[i]
+        if tc < 6:
+            size = 1 << (tc >> 1)
+        elif tc == 6:
+            size = 4
+        else:
+            size = 8
+        v = 0
+        for k in range(size):
+            if big_endian:
+                v = (v << 8) | int(buf[off + k])
+            else:
+                v |= int(buf[off + k]) << (8 * k)
+        if tc == 6:
+            bits32[0] = v
+            raw = float(f32[0])
+        elif tc == 7:
+            bits64[0] = v
+            raw = float(f64[0])
+        else:
+            if tc & 1 and v >= (1 << (8 * size - 1)):
+                v -= 1 << (8 * size)
+            raw = float(v)
+        out[i] = a[i] * raw + b[i]
+
+
+def _get_linear_kernel():
+    """
+    Returns the JIT-compiled _decode_linear_scalars, or None if numpy/numba are not installed.
+    Importing numba is expensive, so it only happens on the first call.
+    """
+    global np, _linear_kernel
+    if _linear_kernel is None:
+        try:
+            import numpy
+            from numba import njit
+        except ImportError:
+            _linear_kernel = False
+        else:
+            np = numpy
+            _linear_kernel = njit(_decode_linear_scalars)
+    return _linear_kernel or None
+
+
+class _SigCtx:
+    """
+    Precomputed per-signal (measurement or characteristic) context for the read/write hot path.
+    addr_ext is the MEMORY_SEGMENT address extension, or None when default_addr_ext applies.
+    to_raw is None for measurements (they are never written).
+    """
+    __slots__ = ("addr", "addr_ext", "dtype", "size", "to_phys", "to_raw", "unit")
+
+    def __init__(self, addr, addr_ext, dtype, size, to_phys, to_raw, unit):
+        self.addr: Optional[int] = addr
+        self.addr_ext: Optional[int] = addr_ext
+        self.dtype: str = dtype
+        self.size: int = size
+        self.to_phys: Callable[[float | int], float | int] = to_phys
+        self.to_raw: Optional[Callable[[float | int], float | int]] = to_raw
+        self.unit: Optional[str] = unit
+
 
 class XcpCalibrationAPI:
     """
@@ -51,15 +218,109 @@ class XcpCalibrationAPI:
         self.a2l = a2l_model
         self.default_addr_ext = default_addr_ext
         self._struct_prefix = "<" if byteorder == "little" else ">"
+        # Precompiled codecs, one per datatype for the selected byteorder
+        self._codec: Dict[str, struct.Struct] = {
+            dt: struct.Struct(self._struct_prefix + info.struct_code) for dt, info in _DTYPE_TABLE.items()
+        }
 
-        # Optional custom converters: name -> (to_phys(raw), to_raw(phys))
-        self.custom_compu: Dict[str, Tuple[Callable[[float], float], Callable[[float], float]]] = {}
+        # Optional custom converters: name -> (to_phys(raw), to_raw(phys)); use register_custom_compu
+        self._custom_compu: Dict[str, Tuple[Callable[[float], float], Callable[[float], float]]] = {}
 
         # Build quick index
         self._meas_by_name: Dict[str, Measurement] = {m.name: m for m in (a2l_model.measurements or [])}
         self._char_by_name: Dict[str, Characteristic] = {c.name: c for c in (a2l_model.characteristics or [])}
         self._compu_by_name: Dict[str, CompuMethod] = {cm.name: cm for cm in (a2l_model.compu_methods or [])}
         self._rl_by_name: Dict[str, RecordLayout] = {rl.name: rl for rl in (a2l_model.record_layouts or [])}
+        self._is_scalar_char = {
+            c.name for c in self._char_by_name.values() if (c.char_type or "").upper() in ("VALUE", "VAL", "SCALAR")
+        }
+
+        # Storage datatype per record layout, parsed once (the A2L model is static)
+        self._rl_dtype: Dict[str, Optional[str]] = {}
+        for rl in self._rl_by_name.values():
+            match = _KNOWN_RE.search(" ".join(rl.entries or []))
+            self._rl_dtype[rl.name] = sys.intern(match.group(0).upper()) if match else None
+
+        # Memory segment intervals as parallel arrays sorted by start address, flattened so that
+        # overlapping/nested segments keep their A2L-order precedence (see _flatten_segments)
+        try:
+            segs: List["MemorySegment"] = a2l_model.memory_segments or []
+        except Exception:
+            segs = []
+        seg_rows = _flatten_segments([
+            (
+                int(seg.address), int(seg.address) + int(seg.size),
+                int(seg.segment_info.address_extension)
+                if seg.segment_info and seg.segment_info.address_extension is not None else None,
+            )
+            for seg in segs
+            if seg.address is not None and seg.size is not None
+        ])
+        self._seg_lo: List[int] = [row[0] for row in seg_rows]
+        self._seg_hi: List[int] = [row[1] for row in seg_rows]
+        self._seg_ae: List[int] = [row[2] for row in seg_rows]
+
+        # Canonical (uppercased, interned) storage datatypes so the hot path never normalizes strings
+        self._meas_dtype_canon: Dict[str, str] = {
+            m.name: sys.intern((m.datatype or "").upper()) for m in self._meas_by_name.values()
+        }
+        self._char_dtype_canon: Dict[str, str] = {
+            c.name: sys.intern(self._infer_value_datatype_from_record_layout(c.record_layout) or "UDWORD")
+            for c in self._char_by_name.values()
+        }
+
+        # COMPU_METHOD conversions compiled into closures: name -> callable
+        self._to_phys: Dict[str, Callable[[float | int], float | int]] = {}
+        self._to_raw: Dict[str, Callable[[float | int], float | int]] = {}
+        # Same conversions specialized for float arguments (no float() coercion)
+        self._to_phys_f: Dict[str, Callable[[float], float]] = {}
+        self._to_raw_f: Dict[str, Callable[[float], float]] = {}
+        for cm in self._compu_by_name.values():
+            self._to_phys[cm.name], self._to_raw[cm.name] = self._compile_compu(cm)
+            self._to_phys_f[cm.name], self._to_raw_f[cm.name] = self._compile_compu(cm, float_input=True)
+        # Methods resolving to identity (IDENTICAL or unsupported), skipped entirely on the hot path
+        self._identity_compu = {n for n, fn in self._to_phys.items() if fn is _identity}
+
+        # Per-signal hot-path context, see _build_signal_contexts
+        self._meas_ctx: Dict[str, _SigCtx] = {}
+        self._char_ctx: Dict[str, _SigCtx] = {}
+        self._build_signal_contexts()
+
+        # read_measurements_phys decode plans keyed by (names, default_addr_ext), oldest dropped first
+        self._phys_plans: Dict[Tuple[Tuple[str, ...], int], List[Tuple]] = {}
+
+        # DAQ streaming state: ODT PID -> (packed codec, names, to_phys callables)
+        self._daq_codec: Dict[int, Tuple[struct.Struct, Tuple[str, ...], Tuple[Callable, ...]]] = {}
+        self._daq_callback: Optional[Callable[[Dict[str, float | int]], None]] = None
+        self._daq_running = False
+
+    def _build_signal_contexts(self):
+        """
+        Precomputes everything a scalar read/write needs into one _SigCtx per measurement/characteristic.
+        to_phys is specialized by storage datatype (float vs integer raw values); to_raw always receives
+        the float physical value from the write path.
+        Rebuilt when a custom COMPU is registered.
+        """
+        self._meas_ctx = {}
+        for name, m in self._meas_by_name.items():
+            dt = self._meas_dtype_canon[name]
+            cm = self._compu_by_name.get(m.compu_method or "")
+            self._meas_ctx[name] = _SigCtx(
+                m.ecu_address, self._segment_addr_ext(m.ecu_address), dt, self._datatype_to_size(dt) or 4,
+                self._resolve_compu(m.compu_method, 0, self._is_float_datatype(dt)),
+                None,
+                cm.unit if cm else None,
+            )
+        self._char_ctx = {}
+        for name, c in self._char_by_name.items():
+            dt = self._char_dtype_canon[name]
+            cm = self._compu_by_name.get(c.compu_method or "")
+            self._char_ctx[name] = _SigCtx(
+                c.address, self._segment_addr_ext(c.address), dt, self._datatype_to_size(dt) or 4,
+                self._resolve_compu(c.compu_method, 0, self._is_float_datatype(dt)),
+                self._resolve_compu(c.compu_method, 1, True),
+                cm.unit if cm and getattr(cm, "unit", None) else getattr(c, "unit", None),
+            )
 
     # ------------ Session convenience ------------
     def connect(self, mode: int = 0x00) -> Dict[str, Any]:
@@ -85,226 +346,166 @@ class XcpCalibrationAPI:
         """
         Try to auto-select address extension by finding the MEMORY_SEGMENT that contains the address.
         If found and segment_info.address_extension is set, return it. Otherwise return self.default_addr_ext.
+        Segments are looked up by binary search over intervals flattened at construction; overlapping
+        segments resolve to the first one in A2L order.
         """
-        try:
-            segs: List["MemorySegment"] = self.a2l.memory_segments or []
-        except Exception:
-            return self.default_addr_ext
-
-        for seg in segs:
-            if seg.address is None or seg.size is None:
-                continue
-            lo = int(seg.address)
-            hi = lo + int(seg.size)
-            if lo <= address < hi:
-                if seg.segment_info and seg.segment_info.address_extension is not None:
-                    return int(seg.segment_info.address_extension)
-                break
+        idx = bisect_right(self._seg_lo, address) - 1
+        if idx >= 0 and address < self._seg_hi[idx]:
+            return self._seg_ae[idx]
         return self.default_addr_ext
 
+    def _segment_addr_ext(self, address: Optional[int]) -> Optional[int]:
+        """
+        Like resolve_addr_ext, but returns None instead of default_addr_ext when no segment applies.
+        """
+        if address is None:
+            return None
+        idx = bisect_right(self._seg_lo, address) - 1
+        if idx >= 0 and address < self._seg_hi[idx]:
+            return self._seg_ae[idx]
+        return None
+
+    def _ctx_addr_ext(self, ctx: _SigCtx) -> int:
+        """
+        Address extension for a signal context: its MEMORY_SEGMENT extension, else default_addr_ext.
+        """
+        return self.default_addr_ext if ctx.addr_ext is None else ctx.addr_ext
+
     # ------------ Data type helpers ------------
+    # Helpers expect canonical (uppercase) datatype tokens, see _meas_dtype_canon/_char_dtype_canon.
     @staticmethod
     def _datatype_to_size(datatype: str) -> Optional[int]:
-        if not datatype:
-            return None
-        dt = datatype.upper()
-        # Common ASAP2 names + synonyms
-        map_sz = {
-            "UBYTE": 1, "SBYTE": 1, "U8": 1, "S8": 1, "BYTE": 1,
-            "UWORD": 2, "SWORD": 2, "U16": 2, "S16": 2, "WORD": 2,
-            "UDWORD": 4, "SDWORD": 4, "ULONG": 4, "SLONG": 4, "U32": 4, "S32": 4, "LONG": 4,
-            "U64": 8, "S64": 8, "A_UINT64": 8, "A_INT64": 8, "QWORD": 8,
-            "FLOAT32_IEEE": 4, "FLOAT64_IEEE": 8,
-            "BOOLEAN": 1, "BOOL": 1,
-        }
-        return map_sz.get(dt)
+        info = _DTYPE_TABLE.get(datatype) if datatype else None
+        return info.size if info else None
 
     @staticmethod
     def _is_float_datatype(datatype: str) -> bool:
-        if not datatype:
-            return False
-        dt = datatype.upper()
-        return dt in ("FLOAT32_IEEE", "FLOAT64_IEEE")
+        info = _DTYPE_TABLE.get(datatype) if datatype else None
+        return info.is_float if info else False
 
-    @staticmethod
-    def _is_signed_datatype(datatype: str) -> bool:
-        if not datatype:
-            return False
-        dt = datatype.upper()
-        return dt in ("SBYTE", "S8", "SWORD", "S16", "SDWORD", "SLONG", "S32", "S64", "A_INT64", "LONG")
-
-    def _pack_from_int(self, datatype: str, value: int) -> bytes:
-        dt = datatype.upper()
-        size = XcpCalibrationAPI._datatype_to_size(dt)
-        if size is None:
-            # Fallback: 4-byte unsigned
-            return int(value).to_bytes(4, self.byteorder, signed=False)
-        if dt in ("SBYTE", "S8"):
-            return int(value).to_bytes(1, self.byteorder, signed=True)
-        if dt in ("UBYTE", "U8", "BOOLEAN", "BOOL", "BYTE"):
-            return int(value).to_bytes(1, self.byteorder, signed=False)
-        if dt in ("SWORD", "S16"):
-            return int(value).to_bytes(2, self.byteorder, signed=True)
-        if dt in ("UWORD", "U16", "WORD"):
-            return int(value).to_bytes(2, self.byteorder, signed=False)
-        if dt in ("SDWORD", "SLONG", "S32", "LONG"):
-            return int(value).to_bytes(4, self.byteorder, signed=True)
-        if dt in ("UDWORD", "ULONG", "U32"):
-            return int(value).to_bytes(4, self.byteorder, signed=False)
-        if dt in ("S64", "A_INT64"):
-            return int(value).to_bytes(8, self.byteorder, signed=True)
-        if dt in ("U64", "A_UINT64", "QWORD"):
-            return int(value).to_bytes(8, self.byteorder, signed=False)
-        if dt == "FLOAT32_IEEE":
-            return struct.pack(self._struct_prefix + "f", float(value))
-        if dt == "FLOAT64_IEEE":
-            return struct.pack(self._struct_prefix + "d", float(value))
-        # Fallback
-        return int(value).to_bytes(size, self.byteorder, signed=False)
-
-    def _unpack_to_int_or_float(self, datatype: str, data: bytes) -> float | int:
-        dt = datatype.upper()
-        if dt in ("SBYTE", "S8"):
-            return int.from_bytes(data[:1], self.byteorder, signed=True)
-        if dt in ("UBYTE", "U8", "BOOLEAN", "BOOL", "BYTE"):
-            return int.from_bytes(data[:1], self.byteorder, signed=False)
-        if dt in ("SWORD", "S16"):
-            return int.from_bytes(data[:2], self.byteorder, signed=True)
-        if dt in ("UWORD", "U16", "WORD"):
-            return int.from_bytes(data[:2], self.byteorder, signed=False)
-        if dt in ("SDWORD", "SLONG", "S32", "LONG"):
-            return int.from_bytes(data[:4], self.byteorder, signed=True)
-        if dt in ("UDWORD", "ULONG", "U32"):
-            return int.from_bytes(data[:4], self.byteorder, signed=False)
-        if dt in ("S64", "A_INT64"):
-            return int.from_bytes(data[:8], self.byteorder, signed=True)
-        if dt in ("U64", "A_UINT64", "QWORD"):
-            return int.from_bytes(data[:8], self.byteorder, signed=False)
-        if dt == "FLOAT32_IEEE":
-            return struct.unpack(self._struct_prefix + "f", data[:4])[0]
-        if dt == "FLOAT64_IEEE":
-            return struct.unpack(self._struct_prefix + "d", data[:8])[0]
-        # Fallback assume unsigned
-        return int.from_bytes(data, self.byteorder, signed=False)
+    def _unpack_to_int_or_float(self, datatype: str, data: bytes, offset: int = 0) -> float | int:
+        codec = self._codec.get(datatype)
+        if codec is None:
+            # Fallback assume 4-byte unsigned
+            return int.from_bytes(data[offset:offset + 4], self.byteorder, signed=False)
+        return codec.unpack_from(data, offset)[0]
 
     def _infer_value_datatype_from_record_layout(self, rl_name: Optional[str]) -> Optional[str]:
         """
         Attempts to extract the ASAP2 storage datatype token for a VALUE characteristic
-        from the RECORD_LAYOUT's entries.
+        from the RECORD_LAYOUT's entries (parsed once at construction).
         Returns the datatype token string (e.g., 'UWORD', 'FLOAT32_IEEE') if found.
         """
         if not rl_name:
             return None
-        rl = self._rl_by_name.get(rl_name)
-        if not rl or not rl.entries:
-            return None
-        known = {
-            "UBYTE", "SBYTE", "U8", "S8", "BYTE",
-            "UWORD", "SWORD", "U16", "S16", "WORD",
-            "UDWORD", "SDWORD", "ULONG", "SLONG", "U32", "S32", "LONG",
-            "U64", "S64", "A_UINT64", "A_INT64", "QWORD",
-            "FLOAT32_IEEE", "FLOAT64_IEEE",
-            "BOOLEAN", "BOOL",
-        }
-        for ln in rl.entries:
-            toks = [t.strip().upper() for t in ln.split()]
-            for t in toks:
-                if t in known:
-                    return t
-        return None
+        return self._rl_dtype.get(rl_name)
 
     def _saturate_to_type_range(self, value: int, datatype: str) -> int:
-        size = self._datatype_to_size(datatype) or 4
-        signed = self._is_signed_datatype(datatype)
-        if self._is_float_datatype(datatype):
+        # Unknown datatypes are treated as 4-byte unsigned
+        info = _DTYPE_TABLE.get(datatype) or _DTYPE_TABLE["UDWORD"]
+        if info.is_float:
             return value  # not used for floats
-        if signed:
-            min_v = -(1 << (8*size - 1))
-            max_v = (1 << (8*size - 1)) - 1
-        else:
-            min_v = 0
-            max_v = (1 << (8*size)) - 1
-        return max(min_v, min(max_v, int(value)))
+        return max(info.min_v, min(info.max_v, int(value)))
+
     # ------------ COMPU utilities ------------
+    @property
+    def custom_compu(self) -> MappingProxyType:
+        """
+        Read-only view of the registered custom converters. Conversions are bound into the per-signal
+        contexts, so changes must go through register_custom_compu.
+        """
+        return MappingProxyType(self._custom_compu)
+
     def register_custom_compu(self, compu_name: str, to_phys: Callable[[float], float], to_raw: Callable[[float], float]):
-        self.custom_compu[compu_name] = (to_phys, to_raw)
+        self._custom_compu[compu_name] = (to_phys, to_raw)
+        self._identity_compu.discard(compu_name)
+        self._phys_plans.clear()
+        self._build_signal_contexts()
+        # A running DAQ list keeps its layout; only its conversions change
+        for odt_num, (codec, names, _) in self._daq_codec.items():
+            self._daq_codec[odt_num] = (codec, names, tuple(self._meas_ctx[name].to_phys for name in names))
 
-    def _apply_compu_to_phys(self, compu_name: Optional[str], raw_val: float | int) -> float | int:
-        if not compu_name:
-            return raw_val
-        if compu_name in self.custom_compu:
-            return self.custom_compu[compu_name][0](float(raw_val))
-        cm = self._compu_by_name.get(compu_name)
-        if not cm:
-            return raw_val
+    @staticmethod
+    def _compile_compu(
+        cm: CompuMethod, float_input: bool = False
+    ) -> Tuple[Callable[[float | int], float | int], Callable[[float | int], float | int]]:
+        """
+        Builds the (to_phys, to_raw) pair for a COMPU_METHOD.
+        With float_input=True the callables assume their argument already is a float and skip float().
+        Unsupported methods or missing coefficients resolve to identity.
+        """
         mtype = (cm.method_type or "").upper()
         coeffs = cm.coeffs or []
-        # IDENTICAL
-        if mtype == "IDENTICAL":
-            return raw_val
         # LINEAR: y = a*x + b
         if mtype == "LINEAR" and len(coeffs) >= 2:
             a, b = coeffs[0], coeffs[1]
-            return a * float(raw_val) + b
+
+            if float_input:
+                def linear_to_phys(x, a=a, b=b):
+                    return a * x + b
+
+                def linear_to_raw(y, a=a, b=b):
+                    if a == 0:
+                        raise ZeroDivisionError("Cannot invert LINEAR compu with a == 0")
+                    return (y - b) / a
+            else:
+                def linear_to_phys(x, a=a, b=b):
+                    return a * float(x) + b
+
+                def linear_to_raw(y, a=a, b=b):
+                    if a == 0:
+                        raise ZeroDivisionError("Cannot invert LINEAR compu with a == 0")
+                    return (float(y) - b) / a
+
+            return linear_to_phys, linear_to_raw
         # RAT_FUNC: y = (a*x + b)/(c*x + d) [+ e]
         if mtype == "RAT_FUNC" and len(coeffs) >= 4:
             a, b, c, d = coeffs[0], coeffs[1], coeffs[2], coeffs[3]
-            y = (a * float(raw_val) + b) / (c * float(raw_val) + d)
-            if len(coeffs) >= 5:
-                y += coeffs[4]
-            return y
-        # Default
-        return raw_val
-
-    def _apply_compu_to_raw(self, compu_name: Optional[str], phys_val: float | int) -> float | int:
-        if not compu_name:
-            return phys_val
-        if compu_name in self.custom_compu:
-            return self.custom_compu[compu_name][1](float(phys_val))
-        cm = self._compu_by_name.get(compu_name)
-        if not cm:
-            return phys_val
-        mtype = (cm.method_type or "").upper()
-        coeffs = cm.coeffs or []
-        if mtype == "IDENTICAL":
-            return phys_val
-        if mtype == "LINEAR" and len(coeffs) >= 2:
-            a, b = coeffs[0], coeffs[1]
-            if a == 0:
-                raise ZeroDivisionError("Cannot invert LINEAR compu with a == 0")
-            return (float(phys_val) - b) / a
-        if mtype == "RAT_FUNC" and len(coeffs) >= 4:
-            a, b, c, d = coeffs[0], coeffs[1], coeffs[2], coeffs[3]
-            y = float(phys_val)
-            denom = (y * c) - a
-            if denom == 0:
-                raise ZeroDivisionError("RAT_FUNC inverse undefined: (y*c - a) == 0")
-            return (b - y * d) / denom
-        return phys_val
-
-    # ------------ Record layout inference (scalar VALUE) ------------
-    def _infer_value_size_from_record_layout(self, rl_name: Optional[str]) -> Optional[int]:
+            e = coeffs[4] if len(coeffs) >= 5 else 0.0
+
+            if float_input:
+                def rat_to_phys(x, a=a, b=b, c=c, d=d, e=e):
+                    return (a * x + b) / (c * x + d) + e
+
+                def rat_to_raw(y, a=a, b=b, c=c, d=d):
+                    denom = (y * c) - a
+                    if denom == 0:
+                        raise ZeroDivisionError("RAT_FUNC inverse undefined: (y*c - a) == 0")
+                    return (b - y * d) / denom
+            else:
+                def rat_to_phys(x, a=a, b=b, c=c, d=d, e=e):
+                    x = float(x)
+                    return (a * x + b) / (c * x + d) + e
+
+                def rat_to_raw(y, a=a, b=b, c=c, d=d):
+                    y = float(y)
+                    denom = (y * c) - a
+                    if denom == 0:
+                        raise ZeroDivisionError("RAT_FUNC inverse undefined: (y*c - a) == 0")
+                    return (b - y * d) / denom
+
+            return rat_to_phys, rat_to_raw
+        # IDENTICAL and anything unsupported
+        return _identity, _identity
+
+    def _resolve_compu(
+        self, compu_name: Optional[str], direction: int, float_input: bool = False
+    ) -> Callable[[float | int], float | int]:
         """
-        Tries to infer the underlying storage size for VALUE characteristics from RECORD_LAYOUT entries.
-        This is heuristic: scans tokens for a known data type token.
+        Returns the conversion callable for a COMPU_METHOD name; direction 0 = to_phys, 1 = to_raw.
+        float_input selects the variant specialized for float arguments.
         """
-        if not rl_name:
-            return None
-        rl = self._rl_by_name.get(rl_name)
-        if not rl or not rl.entries:
-            return None
-        known_types = {
-            "UBYTE": 1, "SBYTE": 1, "U8": 1, "S8": 1,
-            "UWORD": 2, "SWORD": 2, "U16": 2, "S16": 2,
-            "UDWORD": 4, "SDWORD": 4, "ULONG": 4, "SLONG": 4, "U32": 4, "S32": 4,
-            "FLOAT32_IEEE": 4, "FLOAT64_IEEE": 8,
-        }
-        for ln in rl.entries:
-            toks = [t.strip().upper() for t in ln.split()]
-            for t in toks:
-                if t in known_types:
-                    return known_types[t]
-        return None
+        if not compu_name or compu_name in self._identity_compu:
+            return _identity
+        custom = self._custom_compu.get(compu_name)
+        if custom is not None:
+            fn = custom[direction]
+            return fn if float_input else (lambda x, fn=fn: fn(float(x)))
+        if float_input:
+            table = self._to_phys_f if direction == 0 else self._to_raw_f
+        else:
+            table = self._to_phys if direction == 0 else self._to_raw
+        return table.get(compu_name, _identity)
 
     # ------------ Raw memory helpers ------------
     def read_raw(self, address: int, size: int, addr_ext: Optional[int] = None, timeout: Optional[float] = None) -> bytes:
@@ -330,35 +531,264 @@ class XcpCalibrationAPI:
               "unit": Optional[str]
             }
         """
-        m = self.find_measurement(name)
-        if not m:
+        ctx = self._meas_ctx.get(name)
+        if ctx is None:
             raise KeyError(f"Measurement '{name}' not found in A2L model")
-        if m.ecu_address is None:
+        if ctx.addr is None:
             raise ValueError(f"Measurement '{name}' has no address in A2L")
 
-        dt = m.datatype or ""
-        size = self._datatype_to_size(dt) or 4
-        ae = self.resolve_addr_ext(m.ecu_address) if addr_ext is None else addr_ext
-        raw_bytes = self.read_raw(m.ecu_address, size, ae, timeout=timeout)
-        raw_value = self._unpack_to_int_or_float(dt, raw_bytes)
-        phys = self._apply_compu_to_phys(m.compu_method, raw_value)
-
-        unit = None
-        cm = self._compu_by_name.get(m.compu_method or "")
-        if cm:
-            unit = cm.unit
+        if addr_ext is None:
+            addr_ext = self._ctx_addr_ext(ctx)
+        raw_bytes = self.read_raw(ctx.addr, ctx.size, addr_ext, timeout=timeout)
+        raw_value = self._unpack_to_int_or_float(ctx.dtype, raw_bytes)
 
         return {
             "name": name,
-            "address": int(m.ecu_address),
-            "addr_ext": ae,
-            "datatype": dt,
+            "address": int(ctx.addr),
+            "addr_ext": addr_ext,
+            "datatype": ctx.dtype,
             "raw_bytes": raw_bytes,
             "raw_value": raw_value,
-            "physical_value": phys,
-            "unit": unit,
+            "physical_value": ctx.to_phys(raw_value),
+            "unit": ctx.unit,
         }
 
+    def read_measurements(self, names: List[str], timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Reads several measurements with as few XCP uploads as possible.
+        Measurements are grouped by address extension and sorted by address; neighbouring ranges
+        separated by at most _MAX_READ_GAP bytes are fetched with a single read_raw call, limited
+        to what one UPLOAD response can carry (MAX_CTO - 1 bytes).
+
+        Returns:
+            {name: <same dict as read_measurement>}
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        for ae, start, end, run in self._plan_measurement_runs(names):
+            self._read_measurement_run(ae, start, end, run, results, timeout)
+        return results
+
+    def _plan_measurement_runs(self, names: List[str]) -> List[Tuple[int, int, int, List[Tuple[int, int, str, Measurement]]]]:
+        """
+        Groups measurements into upload runs: [(addr_ext, start, end, [(address, size, name, measurement), ...]), ...].
+        """
+        by_ae: Dict[int, List[Tuple[int, int, str, Measurement]]] = {}
+        for name in names:
+            ctx = self._meas_ctx.get(name)
+            if ctx is None:
+                raise KeyError(f"Measurement '{name}' not found in A2L model")
+            if ctx.addr is None:
+                raise ValueError(f"Measurement '{name}' has no address in A2L")
+            by_ae.setdefault(self._ctx_addr_ext(ctx), []).append((int(ctx.addr), ctx.size, name, self._meas_by_name[name]))
+
+        max_len = max(1, self.xcp.max_cto - 1)
+        runs: List[Tuple[int, int, int, List[Tuple[int, int, str, Measurement]]]] = []
+        for ae, items in by_ae.items():
+            items.sort(key=lambda it: it[0])
+            run: List[Tuple[int, int, str, Measurement]] = []
+            run_start = run_end = 0
+            for item in items:
+                address, size = item[0], item[1]
+                if run and address - run_end <= _MAX_READ_GAP and max(run_end, address + size) - run_start <= max_len:
+                    run.append(item)
+                    run_end = max(run_end, address + size)
+                    continue
+                if run:
+                    runs.append((ae, run_start, run_end, run))
+                run = [item]
+                run_start, run_end = address, address + size
+            if run:
+                runs.append((ae, run_start, run_end, run))
+        return runs
+
+    def _read_measurement_run(
+        self,
+        ae: int,
+        start: int,
+        end: int,
+        run: List[Tuple[int, int, str, Measurement]],
+        results: Dict[str, Dict[str, Any]],
+        timeout: Optional[float],
+    ):
+        buf = self.read_raw(start, end - start, ae, timeout=timeout)
+        for address, size, name, _ in run:
+            off = address - start
+            ctx = self._meas_ctx[name]
+            raw_value = self._unpack_to_int_or_float(ctx.dtype, buf, off)
+            results[name] = {
+                "name": name,
+                "address": address,
+                "addr_ext": ae,
+                "datatype": ctx.dtype,
+                "raw_bytes": buf[off:off + size],
+                "raw_value": raw_value,
+                "physical_value": ctx.to_phys(raw_value),
+                "unit": ctx.unit,
+            }
+
+    def read_measurements_phys(self, names: List[str], timeout: Optional[float] = None) -> Dict[str, float | int]:
+        """
+        Reads several measurements like read_measurements but returns only {name: physical_value}.
+        Intended for high-rate polling: when numba is installed, each upload is decoded by a JIT-compiled
+        kernel that also applies IDENTICAL/LINEAR conversions (results are floats). Other datatypes and
+        COMPU_METHODs go through the regular codec/COMPU path. The decode plan is cached per name list
+        (up to _MAX_PHYS_PLANS lists), so pass the same signal list on every poll. numba is imported and
+        the kernel compiled on the first call.
+        """
+        kernel = _get_linear_kernel()
+        if kernel is None:
+            return {n: r["physical_value"] for n, r in self.read_measurements(names, timeout).items()}
+
+        key = (tuple(names), self.default_addr_ext)
+        plan = self._phys_plans.get(key)
+        if plan is None:
+            if len(self._phys_plans) >= _MAX_PHYS_PLANS:
+                del self._phys_plans[next(iter(self._phys_plans))]  # drop the oldest plan
+            plan = self._phys_plans[key] = self._build_phys_plan(names)
+
+        big_endian = self.byteorder == "big"
+        results: Dict[str, float | int] = {}
+        for ae, start, end, kernel_names, offsets, type_codes, a, b, fallback in plan:
+            buf = self.read_raw(start, end - start, ae, timeout=timeout)
+            if kernel_names:
+                out = np.empty(len(kernel_names), np.float64)
+                kernel(np.frombuffer(buf, np.uint8), offsets, type_codes, big_endian, a, b, out)
+                results.update(zip(kernel_names, out.tolist()))
+            for name, off in fallback:
+                ctx = self._meas_ctx[name]
+                results[name] = ctx.to_phys(self._unpack_to_int_or_float(ctx.dtype, buf, off))
+        return results
+
+    def _build_phys_plan(self, names: List[str]) -> List[Tuple]:
+        plan = []
+        for ae, start, end, run in self._plan_measurement_runs(names):
+            kernel_names: List[str] = []
+            offsets: List[int] = []
+            type_codes: List[int] = []
+            a: List[float] = []
+            b: List[float] = []
+            fallback: List[Tuple[str, int]] = []
+            for address, size, name, m in run:
+                dt = self._meas_dtype_canon[name]
+                info = _DTYPE_TABLE.get(dt)
+                tc = _KERNEL_TYPE_CODES.get(info.struct_code) if info else None
+                coeffs = self._linear_coeffs(m.compu_method)
+                if tc is None or coeffs is None:
+                    fallback.append((name, address - start))
+                    continue
+                kernel_names.append(name)
+                offsets.append(address - start)
+                type_codes.append(tc)
+                a.append(coeffs[0])
+                b.append(coeffs[1])
+            plan.append((
+                ae, start, end, kernel_names,
+                np.array(offsets, np.int32), np.array(type_codes, np.int8),
+                np.array(a, np.float64), np.array(b, np.float64),
+                fallback,
+            ))
+        return plan
+
+    def _linear_coeffs(self, compu_name: Optional[str]) -> Optional[Tuple[float, float]]:
+        """
+        Returns (a, b) such that phys = a*raw + b for identity/LINEAR conversions, else None.
+        """
+        if not compu_name:
+            return 1.0, 0.0
+        if compu_name in self._custom_compu:
+            return None
+        cm = self._compu_by_name.get(compu_name)
+        if not cm or compu_name in self._identity_compu:
+            return 1.0, 0.0
+        if (cm.method_type or "").upper() == "LINEAR":
+            return float(cm.coeffs[0]), float(cm.coeffs[1])
+        return None
+
+    # ------------ DAQ streaming ------------
+    def start_daq(
+        self,
+        names: List[str],
+        callback: Callable[[Dict[str, float | int]], None],
+        event_channel: int = 0,
+        prescaler: int = 1,
+        priority: int = 0,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Configures one dynamic DAQ list with the given measurements and starts it. The ECU then sends
+        samples on its own whenever event_channel fires (no upload request per sample); every received
+        ODT is decoded and passed to callback as {name: physical_value} from the XCP listener thread.
+
+        Assumptions: dynamic DAQ configuration, byte-aligned ODT entries, no timestamps and absolute
+        ODT numbering starting at PID 0 (this is the only DAQ list).
+        """
+        if not names:
+            raise ValueError("start_daq needs at least one measurement")
+        capacity = self.xcp.max_dto - 1  # first byte of each DTO is the PID
+        odts: List[List[Tuple[str, int, int, str, int]]] = []
+        used = capacity
+        for name in names:
+            ctx = self._meas_ctx.get(name)
+            if ctx is None:
+                raise KeyError(f"Measurement '{name}' not found in A2L model")
+            address, dt, size = ctx.addr, ctx.dtype, ctx.size
+            if address is None:
+                raise ValueError(f"Measurement '{name}' has no address in A2L")
+            if size > capacity:
+                raise ValueError(f"Measurement '{name}' ({size} bytes) does not fit into one ODT ({capacity} bytes)")
+            if used + size > capacity:
+                odts.append([])
+                used = 0
+            odts[-1].append((name, int(address), size, dt, self._ctx_addr_ext(ctx)))
+            used += size
+
+        self.stop_daq(timeout)
+        self.xcp.free_daq(timeout)
+        self.xcp.alloc_daq(1, timeout)
+        self.xcp.alloc_odt(0, len(odts), timeout)
+        for odt_num, entries in enumerate(odts):
+            self.xcp.alloc_odt_entry(0, odt_num, len(entries), timeout)
+        for odt_num, entries in enumerate(odts):
+            self.xcp.set_daq_ptr(0, odt_num, 0, timeout)
+            for _, address, size, _, ae in entries:
+                # WRITE_DAQ advances the DAQ pointer; bit offset 0xFF = whole element
+                self.xcp.write_daq(0xFF, size, ae, address, timeout)
+        self.xcp.set_daq_list_mode(0, event_channel, prescaler, priority, mode=0x00, timeout=timeout)
+
+        self._daq_codec.clear()
+        for odt_num, entries in enumerate(odts):
+            # Unknown datatypes are read as 4-byte unsigned, as in read_measurement
+            fmt = "".join(_DTYPE_TABLE[dt].struct_code if dt in _DTYPE_TABLE else "I" for _, _, _, dt, _ in entries)
+            self._daq_codec[odt_num] = (
+                struct.Struct(self._struct_prefix + fmt),
+                tuple(name for name, _, _, _, _ in entries),
+                tuple(self._meas_ctx[name].to_phys for name, _, _, _, _ in entries),
+            )
+        self._daq_callback = callback
+        self.xcp.on_daq(self._on_daq_dto)
+        self.xcp.start_stop_daq_list(0, True, timeout)
+        self._daq_running = True
+
+    def stop_daq(self, timeout: Optional[float] = None):
+        """
+        Stops the DAQ list started by start_daq (no-op if none is running).
+        """
+        if not self._daq_running:
+            return
+        self.xcp.start_stop_daq_list(0, False, timeout)
+        self._daq_running = False
+        self._daq_codec.clear()
+        self._daq_callback = None
+
+    def _on_daq_dto(self, odt_pid: int, _values: Dict[str, int], payload: bytes):
+        entry = self._daq_codec.get(odt_pid)
+        callback = self._daq_callback
+        if entry is None or callback is None:
+            return
+        codec, names, to_phys = entry
+        raw = codec.unpack_from(payload)
+        callback({name: fn(r) for name, fn, r in zip(names, to_phys, raw)})
+
     # ------------ Characteristic API (scalar VALUE) ------------
     def read_characteristic(self, name: str, addr_ext: Optional[int] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
         c = self.find_characteristic(name)
@@ -366,23 +796,14 @@ class XcpCalibrationAPI:
             raise KeyError(f"Characteristic '{name}' not found in A2L")
         if c.address is None:
             raise ValueError(f"Characteristic '{name}' has no address in A2L")
-        if (c.char_type or "").upper() not in ("VALUE", "VAL", "SCALAR"):
+        if name not in self._is_scalar_char:
             raise NotImplementedError(f"Characteristic '{name}' type '{c.char_type}' is not scalar VALUE")
 
-        dtype = self._infer_value_datatype_from_record_layout(c.record_layout) or "UDWORD"
-        size = self._datatype_to_size(dtype) or 4
-        ae = self.resolve_addr_ext(c.address) if addr_ext is None else addr_ext
-        raw_bytes = self.read_raw(c.address, size, ae, timeout)
-
-        if self._is_float_datatype(dtype):
-            raw_value = self._unpack_to_int_or_float(dtype, raw_bytes)
-        else:
-            signed = self._is_signed_datatype(dtype)
-            raw_value = int.from_bytes(raw_bytes[:size], self.byteorder, signed=signed)
-
-        phys = self._apply_compu_to_phys(c.compu_method, raw_value)
-        cm = self._compu_by_name.get(c.compu_method or "")
-        unit = cm.unit if cm and getattr(cm, "unit", None) else getattr(c, "unit", None)
+        ctx = self._char_ctx[name]
+        ae = self._ctx_addr_ext(ctx) if addr_ext is None else addr_ext
+        raw_bytes = self.read_raw(c.address, ctx.size, ae, timeout)
+        raw_value = self._unpack_to_int_or_float(ctx.dtype, raw_bytes)
+        phys = ctx.to_phys(raw_value)
 
         return {
             "name": name,
@@ -393,24 +814,21 @@ class XcpCalibrationAPI:
             "raw_bytes": raw_bytes,
             "raw_value": raw_value,
             "physical_value": phys,
-            "unit": unit,
-            "datatype": dtype,
+            "unit": ctx.unit,
+            "datatype": ctx.dtype,
         }
 
-    def write_characteristic(
-        self,
-        name: str,
-        physical_value: float | int,
-        addr_ext: Optional[int] = None,
-        timeout: Optional[float] = None,
-        clamp_limits: bool = True,
-    ):
+    def _characteristic_to_raw(self, name: str, physical_value: float | int, clamp_limits: bool) -> Tuple[Characteristic, _SigCtx, float | int]:
+        """
+        Resolves a scalar VALUE characteristic and converts a physical value to its raw storage value.
+        Returns (characteristic, context, raw_value); integer raw values are rounded and saturated.
+        """
         c = self.find_characteristic(name)
         if not c:
             raise KeyError(f"Characteristic '{name}' not found in A2L")
         if c.address is None:
             raise ValueError(f"Characteristic '{name}' has no address in A2L")
-        if (c.char_type or "").upper() not in ("VALUE", "VAL", "SCALAR"):
+        if name not in self._is_scalar_char:
             raise NotImplementedError(f"Characteristic '{name}' type '{c.char_type}' is not scalar VALUE")
 
         val_phys = float(physical_value)
@@ -420,21 +838,74 @@ class XcpCalibrationAPI:
             if c.upper_limit is not None:
                 val_phys = min(val_phys, float(c.upper_limit))
 
-        raw_val = self._apply_compu_to_raw(c.compu_method, val_phys)
+        ctx = self._char_ctx[name]
+        raw_val = ctx.to_raw(val_phys)
 
-        dtype = self._infer_value_datatype_from_record_layout(c.record_layout) or "UDWORD"
-        size = self._datatype_to_size(dtype) or 4
-        if self._is_float_datatype(dtype):
-            data = self._pack_from_int(dtype, raw_val)
-        else:
-            signed = self._is_signed_datatype(dtype)
-            raw_int = int(round(raw_val))
-            raw_int = self._saturate_to_type_range(raw_int, dtype)
-            data = int(raw_int).to_bytes(size, self.byteorder, signed=signed)
+        if not self._is_float_datatype(ctx.dtype):
+            raw_val = self._saturate_to_type_range(int(round(raw_val)), ctx.dtype)
+        return c, ctx, raw_val
+
+    def write_characteristic(
+        self,
+        name: str,
+        physical_value: float | int,
+        addr_ext: Optional[int] = None,
+        timeout: Optional[float] = None,
+        clamp_limits: bool = True,
+    ):
+        c, ctx, raw_val = self._characteristic_to_raw(name, physical_value, clamp_limits)
+        data = self._codec[ctx.dtype].pack(raw_val)
 
-        ae = self.resolve_addr_ext(c.address) if addr_ext is None else addr_ext
+        ae = self._ctx_addr_ext(ctx) if addr_ext is None else addr_ext
         self.write_raw(c.address, data, ae, timeout)
 
+    def write_characteristics(
+        self,
+        values: Dict[str, float | int],
+        timeout: Optional[float] = None,
+        clamp_limits: bool = True,
+    ):
+        """
+        Writes several scalar VALUE characteristics (name -> physical value) with as few XCP downloads as possible.
+        All values are converted before anything is written. Characteristics are grouped by address extension
+        and sorted by address; back-to-back ranges are assembled into one buffer and sent with a single write_raw.
+        Non-adjacent characteristics are written individually.
+        """
+        by_ae: Dict[int, List[Tuple[int, struct.Struct, float | int]]] = {}
+        for name, physical_value in values.items():
+            c, ctx, raw_val = self._characteristic_to_raw(name, physical_value, clamp_limits)
+            by_ae.setdefault(self._ctx_addr_ext(ctx), []).append((int(c.address), self._codec[ctx.dtype], raw_val))
+
+        for ae, items in by_ae.items():
+            items.sort(key=lambda it: it[0])
+            run: List[Tuple[int, struct.Struct, float | int]] = []
+            run_start = run_end = 0
+            for item in items:
+                address, codec = item[0], item[1]
+                if run and address == run_end:
+                    run.append(item)
+                    run_end += codec.size
+                    continue
+                if run:
+                    self._write_characteristic_run(ae, run_start, run_end, run, timeout)
+                run = [item]
+                run_start, run_end = address, address + codec.size
+            if run:
+                self._write_characteristic_run(ae, run_start, run_end, run, timeout)
+
+    def _write_characteristic_run(
+        self,
+        ae: int,
+        start: int,
+        end: int,
+        run: List[Tuple[int, struct.Struct, float | int]],
+        timeout: Optional[float],
+    ):
+        buf = bytearray(end - start)
+        for address, codec, raw_val in run:
+            codec.pack_into(buf, address - start, raw_val)
+        self.write_raw(start, bytes(buf), ae, timeout)
+
     # ------------ Convenience using direct values ------------
     def read_measurement_raw_value(self, name: str, addr_ext: Optional[int] = None) -> int | float:
         return self.read_measurement(name, addr_ext)["raw_value"]